@@ -1,26 +1,47 @@
+import collections
 import copy
-from typing import Dict, Union
+import itertools
+from typing import Dict, Union, DefaultDict, Iterator
 
+IdCounter = DefaultDict[str, Iterator[int]]
 
-class GraphBuilder():
 
-    #id_counter is a class level field, this way we ensure that id's are unique, and don't have to make them unique when merging graphs
-    id_counter = {}
+def new_id_counter() -> IdCounter:
+    """Create new node id counter (per process id) to be shared by related GraphBuilder instances."""
+    return collections.defaultdict(lambda: itertools.count(1))
 
-    def __init__(self, graph = None):
+
+class _GraphBuilderMeta(type):
+
+    def __setattr__(cls, name, value):
+        if name == "id_counter":
+            # Guard against legacy usage like `GraphBuilder.id_counter = {}` (to reset node ids), which is no-op now.
+            raise AttributeError(
+                "Global `GraphBuilder.id_counter` is not supported anymore:"
+                " node ids are generated per connection (or per builder), there is no global counter to reset."
+            )
+        super().__setattr__(name, value)
+
+
+class GraphBuilder(metaclass=_GraphBuilderMeta):
+
+    def __init__(self, graph = None, id_counter: IdCounter = None):
         """
             Create a process graph builder.
             If a graph is provided, its nodes will be added to this builder, this does not necessarily preserve id's of the nodes.
 
             :param graph: Dict : Optional, existing process graph
+            :param id_counter: Optional node id counter to share with other builders,
+                this way we ensure that id's are unique, and don't have to make them unique when merging graphs
         """
         self.processes = {}
+        self.id_counter = id_counter if id_counter is not None else new_id_counter()
 
         if graph is not None:
             self._merge_processes(graph)
 
     def copy(self,return_key_map=False):
-        the_copy = GraphBuilder()
+        the_copy = GraphBuilder(id_counter=self.id_counter)
         return the_copy._merge_processes(self.processes,return_key_map=return_key_map)
 
     def shallow_copy(self):
@@ -28,13 +49,13 @@ class GraphBuilder():
         Copy, but don't update keys
         :return:
         """
-        the_copy = GraphBuilder()
+        the_copy = GraphBuilder(id_counter=self.id_counter)
         the_copy.processes = copy.deepcopy(self.processes)
         return the_copy
 
     @classmethod
-    def from_process_graph(cls,graph:Dict):
-        builder = GraphBuilder()
+    def from_process_graph(cls,graph:Dict, id_counter: IdCounter = None):
+        builder = GraphBuilder(id_counter=id_counter)
         builder.processes = copy.deepcopy(graph)
         return builder
 
@@ -69,14 +90,14 @@ class GraphBuilder():
 
     def _generate_id(self,name:str):
         name = name.replace("_","")
-        if( not GraphBuilder.id_counter.get(name)):
-            GraphBuilder.id_counter[name] = 1
-        else:
-            GraphBuilder.id_counter[name] += 1
-        return name + str(GraphBuilder.id_counter[name])
+        counter = self.id_counter[name]
+        id = name + str(next(counter))
+        while id in self.processes:
+            id = name + str(next(counter))
+        return id
 
     def merge(self, other: 'GraphBuilder'):
-        return GraphBuilder.from_process_graph(self.processes)._merge_processes(other.processes)
+        return GraphBuilder.from_process_graph(self.processes, id_counter=self.id_counter)._merge_processes(other.processes)
 
     def _merge_processes(self, processes: Dict, return_key_map=False):
         # Maps original node key to new key in merged result
@@ -128,7 +149,8 @@ class GraphBuilder():
     @classmethod
     def combine(cls, operator: str, first: Union['GraphBuilder', dict], second: Union['GraphBuilder', dict], arg_name='data'):
         """Combine two GraphBuilders to a new merged one using the given operator"""
-        merged = cls()
+        id_counter = next((b.id_counter for b in [first, second] if isinstance(b, GraphBuilder)), None)
+        merged = cls(id_counter=id_counter)
 
         def insert_builder(builder: GraphBuilder):
             nonlocal merged
@@ -1,6 +1,7 @@
 import inspect
 import logging
-from typing import Union, Callable, List, Optional, Any
+import weakref
+from typing import Union, Callable, List, Optional, Any, Tuple
 
 from openeo.internal.graph_building import PGNode, _FromNodeMixin
 from openeo.rest import OpenEoClientException
@@ -61,13 +62,29 @@ class ProcessBuilderBase(_FromNodeMixin):
         return self.pgnode
 
 
-def get_parameter_names(process: Callable) -> List[str]:
-    """Get argument (aka parameter) names of given function/callable."""
+# Weak-keyed cache, so that (short-lived) user callbacks and whatever they capture are not kept alive.
+_parameter_names_cache = weakref.WeakKeyDictionary()
+
+
+def _get_parameter_names(process: Callable) -> Tuple[str, ...]:
     signature = inspect.signature(process)
-    return [
+    return tuple(
         p.name for p in signature.parameters.values()
         if p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
-    ]
+    )
+
+
+def get_parameter_names(process: Callable) -> List[str]:
+    """Get argument (aka parameter) names of given function/callable."""
+    try:
+        names = _parameter_names_cache.get(process)
+    except TypeError:
+        # Unhashable or not weak-referenceable callable: skip cache.
+        return list(_get_parameter_names(process))
+    if names is None:
+        names = _parameter_names_cache[process] = _get_parameter_names(process)
+    # Cached result is an immutable tuple, so we can safely return a fresh list each time.
+    return list(names)
 
 
 def convert_callable_to_pgnode(callback: Callable, parent_parameters: Optional[List[str]] = None) -> PGNode:
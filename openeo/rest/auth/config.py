@@ -6,10 +6,15 @@ from local config files.
 # TODO: also allow to set client_id, client_secret, refresh_token through env variables?
 
 
+import contextlib
+import copy
+import functools
 import json
 import logging
+import os
 import platform
 import stat
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import Union, Tuple, Dict
@@ -18,6 +23,12 @@ from openeo import __version__
 from openeo.config import get_user_config_dir, get_user_data_dir
 from openeo.util import rfc3339, deep_get, deep_set
 
+# orjson is optional dependency for faster JSON (de)serialization
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 _PRIVATE_PERMS = stat.S_IRUSR | stat.S_IWUSR
 
 log = logging.getLogger(__name__)
@@ -41,11 +52,41 @@ def utcnow_rfc3339() -> str:
     return rfc3339.datetime(datetime.utcnow())
 
 
+def _json_loads(data: bytes) -> dict:
+    if orjson:
+        return orjson.loads(data)
+    return json.loads(data.decode("utf8"))
+
+
+def _json_dumps(data: dict) -> bytes:
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf8")
+
+
+@functools.lru_cache(maxsize=256)
 def _normalize_url(url: str) -> str:
-    """Normalize a url (trim trailing slash), to simplify equality checking."""
+    """Normalize a url (lowercase scheme, trim trailing slash), to simplify equality checking."""
+    scheme, sep, rest = url.partition("://")
+    if sep:
+        url = scheme.lower() + sep + rest
     return url.rstrip("/") or "/"
 
 
+def _url_key(container: dict, url: str) -> str:
+    """
+    Get key for given url in given dictionary:
+    the normalized url, unless there is only an existing entry that normalizes to the same url
+    (e.g. stored before scheme lowercasing), for backward compatibility with existing files.
+    """
+    key = _normalize_url(url)
+    if key not in container:
+        for existing in container:
+            if isinstance(existing, str) and _normalize_url(existing) == key:
+                return existing
+    return key
+
+
 class PrivateJsonFile:
     """
     Base class for private config/data files in JSON format.
@@ -59,6 +100,9 @@ class PrivateJsonFile:
         if path.is_dir():
             path = path / self.DEFAULT_FILENAME
         self._path = path
+        # In-memory data while in `batch()` mode (None otherwise)
+        self._batch_data = None
+        self._batch_dirty = False
 
     @property
     def path(self) -> Path:
@@ -70,6 +114,8 @@ class PrivateJsonFile:
 
     def load(self, empty_on_file_not_found=True) -> dict:
         """Load all data from file"""
+        if self._batch_data is not None:
+            return self._batch_data
         if not self._path.exists():
             if empty_on_file_not_found:
                 return {}
@@ -77,18 +123,71 @@ class PrivateJsonFile:
         assert_private_file(self._path)
         log.debug("Loading private JSON file {p}".format(p=self._path))
         # TODO: add file locking to avoid race conditions?
-        with self._path.open("r", encoding="utf8") as f:
-            return json.load(f)
+        return _json_loads(self._path.read_bytes())
 
     def _write(self, data: dict):
         """Write whole data to file."""
+        if self._batch_data is not None:
+            # Postpone actual writing to the end of the batch.
+            self._batch_data = data
+            self._batch_dirty = True
+            return
         log.debug("Writing private JSON file {p}".format(p=self._path))
         # TODO: add file locking to avoid race conditions?
-        with self._path.open("w", encoding="utf8") as f:
-            json.dump(data, f, indent=2)
-        self._path.chmod(mode=_PRIVATE_PERMS)
+        content = _json_dumps(data)
+        # Write to private temp file first and move it in place, to avoid a corrupt file when writing fails halfway.
+        # Note: `mkstemp` creates a unique file (readable by user only), so concurrent writers don't interfere.
+        # Resolve symlinks (e.g. from dotfile managers) to write through them instead of replacing them.
+        path = self._path.resolve()
+        fd, tmp_path = tempfile.mkstemp(dir=str(path.parent), prefix=path.name + ".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.chmod(tmp_path, _PRIVATE_PERMS)
+            os.replace(tmp_path, str(path))
+        except BaseException:
+            # Don't leave (secret) data behind.
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
         assert_private_file(self._path)
 
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Context manager to group multiple updates (e.g. `set` calls)
+        into a single file load at the start and a single write at the end.
+
+        Usage example::
+
+            with auth_config.batch():
+                auth_config.set_basic_auth(...)
+                auth_config.set_oidc_client_config(...)
+
+        Nothing is written when the block raises an exception.
+        When a nested batch block raises an exception, its changes are rolled back
+        (but changes from the outer batch are kept).
+        """
+        if self._batch_data is not None:
+            # Already in batch mode: join the outer batch, but roll back own changes on failure.
+            snapshot = copy.deepcopy(self._batch_data), self._batch_dirty
+            try:
+                yield self
+            except BaseException:
+                self._batch_data, self._batch_dirty = snapshot
+                raise
+            return
+        self._batch_data = self.load()
+        self._batch_dirty = False
+        try:
+            yield self
+            data, dirty = self._batch_data, self._batch_dirty
+        finally:
+            self._batch_data = None
+            self._batch_dirty = False
+        if dirty:
+            self._write(data)
+
     def get(self, *keys, default=None) -> Union[dict, str, int]:
         """Load JSON file and do deep get with given keys."""
         result = deep_get(self.load(), *keys, default=default)
@@ -130,14 +229,15 @@ class AuthConfig(PrivateJsonFile):
 
     def get_basic_auth(self, backend: str) -> Tuple[Union[None, str], Union[None, str]]:
         """Get username/password combo for given backend. Values will be None when no config is available."""
-        basic = self.get("backends", _normalize_url(backend), "basic", default={})
+        backends = self.get("backends", default={})
+        basic = deep_get(backends, _url_key(backends, backend), "basic", default={})
         username = basic.get("username")
         password = basic.get("password") if username else None
         return username, password
 
     def set_basic_auth(self, backend: str, username: str, password: Union[str, None]):
         data = self.load()
-        keys = ("backends", _normalize_url(backend), "basic",)
+        keys = ("backends", _url_key(data.get("backends", {}), backend), "basic",)
         # TODO: support multiple basic auth credentials? (pick latest by default for example)
         deep_set(data, *keys, "date", value=utcnow_rfc3339())
         deep_set(data, *keys, "username", value=username)
@@ -151,13 +251,15 @@ class AuthConfig(PrivateJsonFile):
 
         Returns a dict mapping provider_id to dicts with "client_id" and "client_secret" items
         """
-        return self.get("backends", _normalize_url(backend), "oidc", "providers", default={})
+        backends = self.get("backends", default={})
+        return deep_get(backends, _url_key(backends, backend), "oidc", "providers", default={})
 
     def get_oidc_client_configs(self, backend: str, provider_id: str) -> Tuple[str, str]:
         """
         Get client_id and client_secret for given backend+provider_id. Values will be None when no config is available.
         """
-        client = self.get("backends", _normalize_url(backend), "oidc", "providers", provider_id, default={})
+        backends = self.get("backends", default={})
+        client = deep_get(backends, _url_key(backends, backend), "oidc", "providers", provider_id, default={})
         client_id = client.get("client_id")
         client_secret = client.get("client_secret") if client_id else None
         return client_id, client_secret
@@ -167,7 +269,7 @@ class AuthConfig(PrivateJsonFile):
             client_id: Union[str, None], client_secret: Union[str, None] = None, issuer: Union[str, None] = None
     ):
         data = self.load()
-        keys = ("backends", _normalize_url(backend), "oidc", "providers", provider_id)
+        keys = ("backends", _url_key(data.get("backends", {}), backend), "oidc", "providers", provider_id)
         # TODO: support multiple clients? (pick latest by default for example)
         deep_set(data, *keys, "date", value=utcnow_rfc3339())
         deep_set(data, *keys, "client_id", value=client_id)
@@ -189,12 +291,13 @@ class RefreshTokenStore(PrivateJsonFile):
         return get_user_data_dir(auto_create=True) / cls.DEFAULT_FILENAME
 
     def get_refresh_token(self, issuer: str, client_id: str) -> Union[str, None]:
-        return self.get(_normalize_url(issuer), client_id, "refresh_token", default=None)
+        data = self.load()
+        return deep_get(data, _url_key(data, issuer), client_id, "refresh_token", default=None)
 
     def set_refresh_token(self, issuer: str, client_id: str, refresh_token: str):
         data = self.load()
         log.info("Storing refresh token for issuer {i!r} (client {c!r})".format(i=issuer, c=client_id))
-        deep_set(data, _normalize_url(issuer), client_id, value={
+        deep_set(data, _url_key(data, issuer), client_id, value={
             "date": utcnow_rfc3339(),
             "refresh_token": refresh_token,
         })
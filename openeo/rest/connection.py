@@ -21,6 +21,7 @@ import openeo
 from openeo.capabilities import ApiVersionException, ComparableVersion
 from openeo.config import get_config_option, config_log
 from openeo.internal.graph_building import PGNode, as_flat_graph
+from openeo.internal.graphbuilder_040 import new_id_counter
 from openeo.internal.jupyter import VisualDict, VisualList
 from openeo.internal.processes.builder import ProcessBuilderBase
 from openeo.metadata import CollectionMetadata
@@ -236,6 +237,8 @@ class Connection(RestApiConnection):
             slow_response_threshold=slow_response_threshold,
         )
         self._capabilities_cache = LazyLoadCache()
+        # Node id counter for (0.4.0 style) ImageCollectionClient graphs, to keep node ids unique within connection.
+        self._graph_id_counter = new_id_counter()
 
         # Initial API version check.
         if self._api_version.below(self._MINIMUM_API_VERSION):
@@ -735,7 +738,10 @@ class Connection(RestApiConnection):
         :return: collection metadata.
         """
         # TODO: duplication with `Connection.collection_metadata`: deprecate one or the other?
-        data = self.get(f"/collections/{collection_id}", expected_status=200).json()
+        data = self._capabilities_cache.get(
+            key=("collection", collection_id),
+            load=lambda: self.get(f"/collections/{collection_id}", expected_status=200).json()
+        )
         return VisualDict("collection", data=data)
 
     def collection_items(self, name, spatial_extent: Optional[List[float]] = None, temporal_extent: Optional[List[Union[str, datetime.datetime]]] = None, limit: int = None) -> Iterator[dict]:
@@ -894,7 +900,7 @@ class Connection(RestApiConnection):
     @property
     def _api_version(self) -> ComparableVersion:
         # TODO make this a public property (it's also useful outside the Connection class)
-        return self.capabilities().api_version_check
+        return self._capabilities_cache.get("api_version", load=lambda: self.capabilities().api_version_check)
 
     def datacube_from_process(self, process_id: str, namespace: str = None, **kwargs) -> DataCube:
         """
@@ -977,7 +983,8 @@ class Connection(RestApiConnection):
         else:
             return ImageCollectionClient.load_collection(
                 collection_id=collection_id, session=self,
-                spatial_extent=spatial_extent, temporal_extent=temporal_extent, bands=bands
+                spatial_extent=spatial_extent, temporal_extent=temporal_extent, bands=bands,
+                id_counter=self._graph_id_counter,
             )
 
     imagecollection = legacy_alias(load_collection, name="imagecollection")
@@ -1187,7 +1194,9 @@ class Connection(RestApiConnection):
         if self._api_version.at_least("1.0.0"):
             return DataCube.load_disk_collection(self, format, glob_pattern, **options)
         else:
-            return ImageCollectionClient.load_disk_collection(self, format, glob_pattern, **options)
+            return ImageCollectionClient.load_disk_collection(
+                self, format, glob_pattern, id_counter=self._graph_id_counter, **options
+            )
 
     def as_curl(self, data: Union[dict, DataCube], path="/result", method="POST") -> str:
         """
@@ -1293,7 +1302,7 @@ def session(userid=None, endpoint: str = "https://openeo.org/openeo") -> Connect
     If the backend requires authentication, you should set pass your credentials.
 
     :param endpoint: The http url of an OpenEO endpoint.
-    :rtype: openeo.sessions.Session
+    :rtype: openeo.rest.connection.Connection
     """
     return connect(url=endpoint)
 
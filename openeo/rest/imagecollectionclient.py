@@ -8,7 +8,7 @@ from typing import List, Dict, Union, Tuple
 from shapely.geometry import Polygon, MultiPolygon, mapping
 
 from openeo.imagecollection import ImageCollection
-from openeo.internal.graphbuilder_040 import GraphBuilder
+from openeo.internal.graphbuilder_040 import GraphBuilder, IdCounter
 from openeo.metadata import CollectionMetadata
 from openeo.rest import BandMathException
 from openeo.rest.job import BatchJob, RESTJob
@@ -55,7 +55,8 @@ class ImageCollectionClient(ImageCollection):
             spatial_extent: Union[Dict[str, float], None] = None,
             temporal_extent: Union[List[Union[str,datetime.datetime,datetime.date]], None] = None,
             bands: Union[List[str], None] = None,
-            fetch_metadata=True
+            fetch_metadata=True,
+            id_counter: IdCounter = None,
     ):
         """
         Create a new Image Collection/Raster Data cube.
@@ -65,10 +66,11 @@ class ImageCollectionClient(ImageCollection):
         :param spatial_extent: limit data to specified bounding box or polygons
         :param temporal_extent: limit data to specified temporal interval
         :param bands: only add the specified bands
+        :param id_counter: node id counter to share with other image collections (e.g. to merge with)
         :return:
         """
         # TODO: rename function to load_collection for better similarity with corresponding process id?
-        builder = GraphBuilder()
+        builder = GraphBuilder(id_counter=id_counter)
         process_id = 'load_collection'
         normalized_temporal_extent = list(get_temporal_extent(extent=temporal_extent)) if temporal_extent is not None else None
         arguments = {
@@ -91,17 +93,20 @@ class ImageCollectionClient(ImageCollection):
     create_collection = legacy_alias(load_collection, "create_collection")
 
     @classmethod
-    def load_disk_collection(cls, session: 'Connection', file_format: str, glob_pattern: str, **options) -> 'ImageCollection':
+    def load_disk_collection(
+            cls, session: 'Connection', file_format: str, glob_pattern: str, id_counter: IdCounter = None, **options
+    ) -> 'ImageCollection':
         """
         Loads image data from disk as an ImageCollection.
 
         :param session: The session to use to connect with the backend.
         :param file_format: the file format, e.g. 'GTiff'
         :param glob_pattern: a glob pattern that matches the files to load from disk
+        :param id_counter: node id counter to share with other image collections (e.g. to merge with)
         :param options: options specific to the file format
         :return: the data as an ImageCollection
         """
-        builder = GraphBuilder()
+        builder = GraphBuilder(id_counter=id_counter)
 
         process_id = 'load_disk_data'
         arguments = {
@@ -271,7 +276,7 @@ class ImageCollectionClient(ImageCollection):
         extend_previous_callback_graph = my_builder is not None
         # TODO: why does these `add_process` calls use "expression" instead of "data" like the other cases?
         if not extend_previous_callback_graph:
-            new_builder = GraphBuilder()
+            new_builder = GraphBuilder(id_counter=self.builder.id_counter)
             # TODO merge both process graphs?
             new_builder.add_process(operator, expression={'from_argument': 'data'}, result=True)
         else:
@@ -462,7 +467,7 @@ class ImageCollectionClient(ImageCollection):
             new_builder = None
             extend_previous_callback_graph = my_builder is not None
             if not extend_previous_callback_graph:
-                new_builder = GraphBuilder()
+                new_builder = GraphBuilder(id_counter=self.builder.id_counter)
                 # TODO merge both process graphs?
                 new_builder.add_process(operator, x={'from_argument': 'data'}, y = other, result=True)
             else:
@@ -482,7 +487,7 @@ class ImageCollectionClient(ImageCollection):
         new_builder = None
         extend_previous_callback_graph = my_builder is not None
         if not extend_previous_callback_graph:
-            new_builder = GraphBuilder()
+            new_builder = GraphBuilder(id_counter=self.builder.id_counter)
             # TODO merge both process graphs?
             new_builder.add_process(operator, data=[{'from_argument': 'data'}, other], result=True)
         else:
@@ -498,7 +503,7 @@ class ImageCollectionClient(ImageCollection):
         if current_node["process_id"] == "reduce":
             # TODO: check "dimension" of "reduce" in some way?
             callback_graph = current_node["arguments"]["reducer"]["callback"]
-            return GraphBuilder.from_process_graph(callback_graph)
+            return GraphBuilder.from_process_graph(callback_graph, id_counter=self.builder.id_counter)
         return None
 
     def add_dimension(self, name: str, label: Union[str, int, float], type: str = "other"):
@@ -1018,7 +1023,7 @@ class ImageCollectionClient(ImageCollection):
 
     def _graph_merge(self, other_graph:Dict):
         newbuilder = self.builder.shallow_copy()
-        merged = newbuilder.merge(GraphBuilder.from_process_graph(other_graph))
+        merged = newbuilder.merge(GraphBuilder.from_process_graph(other_graph, id_counter=self.builder.id_counter))
         # TODO: properly update metadata as well?
         newCollection = ImageCollectionClient(self.node_id, merged, self.session, metadata=self.metadata)
         return newCollection
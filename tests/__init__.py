@@ -1,17 +1,27 @@
-import json
+import functools
 import os
 from pathlib import Path
 from typing import Callable
 
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json
+
 
 def get_test_resource(relative_path: str) -> Path:
     dir = Path(os.path.dirname(os.path.realpath(__file__)))
     return dir / relative_path
 
 
+@functools.lru_cache(maxsize=None)
+def _read_test_resource(relative_path: str) -> str:
+    # Only cache raw (immutable) file contents, so each caller gets freshly parsed data it can mutate.
+    return get_test_resource(relative_path).read_bytes().decode("utf8")
+
+
 def load_json_resource(relative_path, preprocess: Callable = None):
-    with get_test_resource(relative_path).open('r+') as f:
-        data = f.read()
-        if preprocess:
-            data = preprocess(data)
-        return json.loads(data)
+    data = _read_test_resource(str(relative_path))
+    if preprocess:
+        data = preprocess(data)
+    return _json.loads(data)
@@ -1,5 +1,7 @@
+import gc
 import logging
 import re
+import weakref
 
 import pytest
 
@@ -30,6 +32,36 @@ def test_get_parameter_names():
     assert get_parameter_names(add_stuff) == ["foo", "bar"]
 
 
+def test_get_parameter_names_cached_no_aliasing():
+    def add_stuff(foo, bar):
+        return foo + bar
+
+    names = get_parameter_names(add_stuff)
+    names.append("baz")
+    assert get_parameter_names(add_stuff) == ["foo", "bar"]
+
+
+def test_get_parameter_names_unhashable():
+    class Adder:
+        __hash__ = None
+
+        def __call__(self, x, y):
+            return x + y
+
+    assert get_parameter_names(Adder()) == ["x", "y"]
+
+
+def test_get_parameter_names_no_strong_reference():
+    def add_stuff(foo, bar):
+        return foo + bar
+
+    assert get_parameter_names(add_stuff) == ["foo", "bar"]
+    ref = weakref.ref(add_stuff)
+    del add_stuff
+    gc.collect()
+    assert ref() is None
+
+
 class TestConvertCallableToPgnode:
 
     def test_simple_lambda(self):
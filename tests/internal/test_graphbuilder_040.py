@@ -1,12 +1,9 @@
 from unittest import TestCase
-from openeo.internal.graphbuilder_040 import GraphBuilder
+from openeo.internal.graphbuilder_040 import GraphBuilder, new_id_counter
 
 
 class GraphBuilderTest(TestCase):
 
-    def setUp(self) -> None:
-        GraphBuilder.id_counter = {}
-
     def test_create_empty(self):
         builder = GraphBuilder()
         builder.process("sum",{})
@@ -39,7 +36,7 @@ class GraphBuilderTest(TestCase):
         builder = GraphBuilder(graph)
 
         print(builder.processes)
-        self.assertEqual(2,builder.id_counter["sum"])
+        self.assertEqual({"sum1", "sum2"}, set(builder.processes.keys()))
 
     def test_merge(self):
         graph1 = {
@@ -94,11 +91,29 @@ class GraphBuilderTest(TestCase):
 
         import json
         print(json.dumps(merged, indent=2))
-        self.assertIn("sum1", merged)
-        self.assertIn("sum4",merged)
-        self.assertIn("sum5", merged)
-        self.assertEqual("sum4",merged["sum5"]["arguments"]["data"]["from_node"])
-        self.assertEqual("sum4", merged["sum5"]["arguments"]["data2"][0]["from_node"])
+        self.assertEqual({"sum1", "sum2", "sum3"}, set(merged.keys()))
+        self.assertEqual("node1", merged["sum1"]["arguments"]["data1"]["from_node"])
+        self.assertEqual("sum2", merged["sum3"]["arguments"]["data"]["from_node"])
+        self.assertEqual("sum2", merged["sum3"]["arguments"]["data2"][0]["from_node"])
+
+    def test_shared_id_counter(self):
+        id_counter = new_id_counter()
+        builder1 = GraphBuilder(id_counter=id_counter)
+        builder2 = GraphBuilder(id_counter=id_counter)
+        self.assertEqual("sum1", builder1.process("sum", {}))
+        self.assertEqual("sum2", builder2.process("sum", {}))
+        self.assertEqual("sum3", builder1.shallow_copy().process("sum", {}))
+        self.assertEqual("sum1", GraphBuilder().process("sum", {}))
+
+    def test_skip_existing_ids(self):
+        builder = GraphBuilder.from_process_graph({"sum1": {"process_id": "sum", "arguments": {}}})
+        self.assertEqual("sum2", builder.process("sum", {}))
+        self.assertEqual({"sum1", "sum2"}, set(builder.processes.keys()))
+
+    def test_legacy_global_id_counter_reset(self):
+        with self.assertRaisesRegex(AttributeError, "not supported anymore"):
+            GraphBuilder.id_counter = {}
+        self.assertFalse(hasattr(GraphBuilder, "id_counter"))
 
     def test_merge_issue50(self):
         """https://github.com/Open-EO/openeo-python-client/issues/50"""
@@ -118,6 +118,68 @@ def test_build_and_flatten_namespace():
     assert node.flat_graph() == {"foo1": {"process_id": "foo", "namespace": "bar", "arguments": {}, "result": True}}
 
 
+def test_flat_graph_mutable_argument():
+    extent = {"west": 1}
+    node = PGNode("load_collection", spatial_extent=extent)
+    assert node.flat_graph()["loadcollection1"]["arguments"] == {"spatial_extent": {"west": 1}}
+    extent["west"] = 5
+    assert node.flat_graph()["loadcollection1"]["arguments"] == {"spatial_extent": {"west": 5}}
+
+
+def test_flat_graph_after_update_arguments():
+    constant = PGNode("constant", x=1)
+    node = PGNode("add", x=constant, y=2)
+    assert node.flat_graph() == {
+        "constant1": {"process_id": "constant", "arguments": {"x": 1}},
+        "add1": {"process_id": "add", "arguments": {"x": {"from_node": "constant1"}, "y": 2}, "result": True},
+    }
+    constant.update_arguments(x=3)
+    assert node.flat_graph() == {
+        "constant1": {"process_id": "constant", "arguments": {"x": 3}},
+        "add1": {"process_id": "add", "arguments": {"x": {"from_node": "constant1"}, "y": 2}, "result": True},
+    }
+
+
+def test_build_and_flatten_reused_node():
+    constant = PGNode("constant", x=1)
+    node = PGNode("add", x=constant, y=constant)
+    assert node.flat_graph() == {
+        "constant1": {"process_id": "constant", "arguments": {"x": 1}},
+        "add1": {
+            "process_id": "add",
+            "arguments": {"x": {"from_node": "constant1"}, "y": {"from_node": "constant1"}},
+            "result": True,
+        },
+    }
+
+
+def test_build_and_flatten_structurally_identical_nodes():
+    # Structurally identical (but distinct) nodes are not merged implicitly.
+    node = PGNode("add", x=PGNode("constant", x=1), y=PGNode("constant", x=1))
+    assert node.flat_graph() == {
+        "constant1": {"process_id": "constant", "arguments": {"x": 1}},
+        "constant2": {"process_id": "constant", "arguments": {"x": 1}},
+        "add1": {
+            "process_id": "add",
+            "arguments": {"x": {"from_node": "constant1"}, "y": {"from_node": "constant2"}},
+            "result": True,
+        },
+    }
+
+
+def test_build_and_flatten_similar_nodes_different_namespace():
+    node = PGNode("add", x=PGNode("foo", namespace="a"), y=PGNode("foo", namespace="b"))
+    assert node.flat_graph() == {
+        "foo1": {"process_id": "foo", "namespace": "a", "arguments": {}},
+        "foo2": {"process_id": "foo", "namespace": "b", "arguments": {}},
+        "add1": {
+            "process_id": "add",
+            "arguments": {"x": {"from_node": "foo1"}, "y": {"from_node": "foo2"}},
+            "result": True,
+        },
+    }
+
+
 def test_pgnode_to_dict_subprocess_graphs():
     load_collection = PGNode("load_collection", collection_id="S2")
     band2 = PGNode("array_element", data={"from_argument": "data"}, index=2)
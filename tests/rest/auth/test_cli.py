@@ -428,8 +428,9 @@ def test_oidc_auth_auth_code_flow(auth_config, refresh_token_store, requests_moc
     ]})
 
     client_id, client_secret = "z3-cl13nt", "z3-z3cr3t-y6y6"
-    auth_config.set_oidc_client_config("https://oeo.test", "authit", client_id, client_secret)
-    auth_config.set_oidc_client_config("https://oeo.test", "youauth", client_id + '-tw00', client_secret + '-tw00')
+    with auth_config.batch():
+        auth_config.set_oidc_client_config("https://oeo.test", "authit", client_id, client_secret)
+        auth_config.set_oidc_client_config("https://oeo.test", "youauth", client_id + '-tw00', client_secret + '-tw00')
 
     oidc_mock = OidcMock(
         requests_mock=requests_mock,
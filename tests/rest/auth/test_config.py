@@ -1,4 +1,5 @@
 import json
+import os
 from unittest import mock
 
 import pytest
@@ -52,6 +53,62 @@ class TestPrivateJsonFile:
             data = json.load(f)
         assert data == {"foo": {"bar": 42}}
 
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_set_get_json_implementation(self, tmp_path, use_orjson):
+        orjson = pytest.importorskip("orjson") if use_orjson else None
+        with mock.patch.object(openeo.rest.auth.config, "orjson", orjson):
+            private = PrivateJsonFile(tmp_path)
+            private.set("foo", "bar", value="b\u00e9r")
+            assert private.get("foo", "bar") == "b\u00e9r"
+        with private.path.open("r", encoding="utf8") as f:
+            data = json.load(f)
+        assert data == {"foo": {"bar": "b\u00e9r"}}
+
+    def test_set_atomic_write(self, tmp_path):
+        private = PrivateJsonFile(tmp_path)
+        private.set("foo", value=1)
+        with mock.patch("os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError, match="disk full"):
+                private.set("foo", value=2)
+        assert private.get("foo") == 1
+        private.set("foo", value=3)
+        assert private.get("foo") == 3
+        assert [p.name for p in tmp_path.iterdir()] == [PrivateJsonFile.DEFAULT_FILENAME]
+
+    def test_set_write_failure_cleanup(self, tmp_path):
+        private = PrivateJsonFile(tmp_path)
+        with mock.patch.object(openeo.rest.auth.config, "_json_dumps", return_value="not bytes"):
+            with pytest.raises(TypeError):
+                private.set("foo", value=1)
+        assert list(tmp_path.iterdir()) == []
+
+    def test_set_unique_temp_file(self, tmp_path):
+        private = PrivateJsonFile(tmp_path)
+        with mock.patch("os.replace", wraps=os.replace) as replace:
+            private.set("foo", value=1)
+            private.set("foo", value=2)
+        (src1, _), (src2, _) = [c[0] for c in replace.call_args_list]
+        assert src1 != src2
+        assert private.get("foo") == 2
+
+    def test_set_symlink(self, tmp_path):
+        target = tmp_path / "dotfiles" / "private.json"
+        target.parent.mkdir()
+        PrivateJsonFile(target).set("foo", value=1)
+        link = tmp_path / "private.json"
+        link.symlink_to(target)
+        private = PrivateJsonFile(link)
+        private.set("foo", value=2)
+        assert link.is_symlink()
+        assert PrivateJsonFile(target).get("foo") == 2
+
+    def test_set_write_failure_keeps_original_error(self, tmp_path):
+        private = PrivateJsonFile(tmp_path)
+        with mock.patch("os.replace", side_effect=OSError("disk full")), \
+                mock.patch("os.remove", side_effect=FileNotFoundError):
+            with pytest.raises(OSError, match="disk full"):
+                private.set("foo", value=1)
+
     def test_remove_no_file(self, tmp_path):
         private = PrivateJsonFile(tmp_path)
         assert not private.path.exists()
@@ -65,6 +122,59 @@ class TestPrivateJsonFile:
         private.remove()
         assert not private.path.exists()
 
+    def test_batch(self, tmp_path):
+        private = PrivateJsonFile(tmp_path)
+        with mock.patch.object(
+                openeo.rest.auth.config, "_json_dumps", wraps=openeo.rest.auth.config._json_dumps
+        ) as dump:
+            with private.batch():
+                private.set("foo", value=1)
+                private.set("bar", "baz", value=2)
+                assert not private.path.exists()
+                assert private.get("foo") == 1
+            assert dump.call_count == 1
+        assert private.get("foo") == 1
+        assert private.get("bar", "baz") == 2
+        assert private.path.stat().st_mode & 0o777 == 0o600
+
+    def test_batch_nested(self, tmp_path):
+        private = PrivateJsonFile(tmp_path)
+        with private.batch():
+            private.set("foo", value=1)
+            with private.batch():
+                private.set("bar", value=2)
+            assert not private.path.exists()
+        assert private.load() == {"foo": 1, "bar": 2}
+
+    def test_batch_nested_exception(self, tmp_path):
+        private = PrivateJsonFile(tmp_path)
+        with private.batch():
+            private.set("foo", value=1)
+            with pytest.raises(RuntimeError):
+                with private.batch():
+                    private.set("foo", value=2)
+                    private.set("bar", value=3)
+                    raise RuntimeError
+            assert private.load() == {"foo": 1}
+        assert private.load() == {"foo": 1}
+
+    def test_batch_no_changes(self, tmp_path):
+        private = PrivateJsonFile(tmp_path)
+        with private.batch():
+            assert private.get("foo") is None
+        assert not private.path.exists()
+
+    def test_batch_exception(self, tmp_path):
+        private = PrivateJsonFile(tmp_path)
+        private.set("foo", value=1)
+        with pytest.raises(RuntimeError):
+            with private.batch():
+                private.set("foo", value=2)
+                raise RuntimeError
+        assert private.get("foo") == 1
+        private.set("bar", value=3)
+        assert private.load() == {"foo": 1, "bar": 3}
+
 
 class TestAuthConfig:
 
@@ -90,6 +200,8 @@ class TestAuthConfig:
     @pytest.mark.parametrize(["to_set", "to_get"], [
         ("https://oeo.test", "https://oeo.test/"),
         ("https://oeo.test/", "https://oeo.test"),
+        ("HTTPS://oeo.test", "https://oeo.test/"),
+        ("https://oeo.test/", "Https://oeo.test"),
     ])
     def test_basic_auth_url_normalization(self, tmp_path, to_set, to_get):
         config = AuthConfig(path=tmp_path)
@@ -97,6 +209,24 @@ class TestAuthConfig:
         assert config.get_basic_auth(to_set) == ("John", "j0hn123")
         assert config.get_basic_auth(to_get) == ("John", "j0hn123")
 
+    def test_legacy_url_normalization(self, tmp_path):
+        # Entries stored before scheme lowercasing should still be found
+        config = AuthConfig(path=tmp_path)
+        config._write({"backends": {"HTTPS://oeo.test": {
+            "basic": {"username": "John", "password": "j0hn123"},
+            "oidc": {"providers": {"default": {"client_id": "client123", "client_secret": "$6cr67"}}},
+        }}})
+        assert config.get_basic_auth("HTTPS://oeo.test/") == ("John", "j0hn123")
+        assert config.get_oidc_client_configs("HTTPS://oeo.test", "default") == ("client123", "$6cr67")
+        assert config.get_oidc_provider_configs("HTTPS://oeo.test") == {
+            "default": {"client_id": "client123", "client_secret": "$6cr67"}
+        }
+        assert config.get_basic_auth("https://oeo.test") == ("John", "j0hn123")
+        assert config.get_oidc_client_configs("Https://oeo.test/", "default") == ("client123", "$6cr67")
+        config.set_basic_auth("https://oeo.test", "Jane", "j4n3")
+        assert config.get_basic_auth("HTTPS://oeo.test") == ("Jane", "j4n3")
+        assert set(config.load()["backends"].keys()) == {"HTTPS://oeo.test"}
+
     def test_oidc(self, tmp_path):
         config = AuthConfig(path=tmp_path)
         with mock.patch.object(openeo.rest.auth.config, "utcnow_rfc3339", return_value="2020-06-08T11:18:27Z"):
@@ -116,6 +246,8 @@ class TestAuthConfig:
     @pytest.mark.parametrize(["to_set", "to_get"], [
         ("https://oeo.test", "https://oeo.test/"),
         ("https://oeo.test/", "https://oeo.test"),
+        ("HTTPS://oeo.test", "https://oeo.test/"),
+        ("https://oeo.test/", "Https://oeo.test"),
     ])
     def test_oidc_backend_normalization(self, tmp_path, to_set, to_get):
         config = AuthConfig(path=tmp_path)
@@ -127,6 +259,18 @@ class TestAuthConfig:
                 "default": {"date": "2020-06-08T11:18:27Z", "client_id": "client123", "client_secret": "$6cr67"}
             }
 
+    def test_batch(self, tmp_path):
+        config = AuthConfig(path=tmp_path)
+        with config.batch():
+            config.set_basic_auth("oeo.test", "John", "j0hn123")
+            config.set_oidc_client_config("oeo.test", "default", client_id="client123", client_secret="$6cr67")
+            config.set_oidc_client_config("oeo.test", "other", client_id="client456")
+            assert not config.path.exists()
+        assert config.get_basic_auth("oeo.test") == ("John", "j0hn123")
+        assert config.get_oidc_client_configs("oeo.test", "default") == ("client123", "$6cr67")
+        assert config.get_oidc_client_configs("oeo.test", "other") == ("client456", None)
+        assert config.load()["metadata"]["type"] == "AuthConfig"
+
     def test_tmp_openeo_config_home(self, tmp_openeo_config_home, tmp_path):
         expected_dir = str(tmp_path)
         assert str(AuthConfig.default_path()).startswith(expected_dir)
@@ -158,3 +302,12 @@ class TestRefreshTokenStorage:
         r = RefreshTokenStore(path=tmp_path)
         r.set_refresh_token("foo", "bar", "ih6zdaT0k3n")
         assert r.get_refresh_token("foo", "bar") == "ih6zdaT0k3n"
+
+    def test_legacy_url_normalization(self, tmp_path):
+        r = RefreshTokenStore(path=tmp_path)
+        r._write({"HTTPS://oidc.test": {"bar": {"refresh_token": "ih6zdaT0k3n"}}})
+        assert r.get_refresh_token("HTTPS://oidc.test", "bar") == "ih6zdaT0k3n"
+        assert r.get_refresh_token("https://oidc.test/", "bar") == "ih6zdaT0k3n"
+        r.set_refresh_token("https://oidc.test", "bar", "n3wT0k3n")
+        assert r.get_refresh_token("HTTPS://oidc.test", "bar") == "n3wT0k3n"
+        assert set(r.load().keys()) == {"HTTPS://oidc.test"}
@@ -1,6 +1,6 @@
 import pytest
 
-import openeo.internal.graphbuilder_040
+from openeo.rest.connection import Connection
 
 
 @pytest.fixture(params=["0.4.0", "1.0.0"])
@@ -8,12 +8,6 @@ def api_version(request):
     return request.param
 
 
-def reset_graphbuilder():
-    # Reset 0.4.0 style graph builder
-    openeo.internal.graphbuilder_040.GraphBuilder.id_counter = {}
-
-
-@pytest.fixture(autouse=True)
-def auto_reset():
-    """Fixture to automatically reset builders, counters, ..."""
-    reset_graphbuilder()
+def reset_graphbuilder(connection: Connection):
+    # Reset node id counter of 0.4.0 style graph builders of given connection
+    connection._graph_id_counter.clear()
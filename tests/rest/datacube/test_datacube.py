@@ -447,7 +447,7 @@ def test_apply_dimension(connection, requests_mock):
     s22 = connection.load_collection("S22")
 
     for dim in ["color", "alpha", "date"]:
-        reset_graphbuilder()
+        reset_graphbuilder(connection)
         cube = s22.apply_dimension(dimension=dim, code="subtract_mean")
         assert cube.flat_graph()["applydimension1"]["process_id"] == "apply_dimension"
         assert cube.flat_graph()["applydimension1"]["arguments"]["dimension"] == dim
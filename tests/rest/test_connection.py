@@ -379,6 +379,16 @@ def test_capabilities_caching(requests_mock):
     assert m.call_count == 1
 
 
+def test_api_version_caching(requests_mock):
+    m = requests_mock.get("https://oeo.test/", json={"api_version": "1.0.0"})
+    con = Connection(API_URL)
+    assert m.call_count == 1
+    api_version = con._api_version
+    assert api_version == ComparableVersion("1.0.0")
+    assert con._api_version is api_version
+    assert m.call_count == 1
+
+
 def test_file_formats(requests_mock):
     requests_mock.get("https://oeo.test/", json={"api_version": "1.0.0"})
     m = requests_mock.get("https://oeo.test/file_formats", json={"output": {"GTiff": {"gis_data_types": ["raster"]}}})
@@ -1884,6 +1894,32 @@ def test_list_processes_namespace(requests_mock):
     assert m.call_count == 1
 
 
+def test_describe_collection(requests_mock):
+    requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+    conn = Connection(API_URL)
+    collection = {"id": "S2", "summaries": {"eo:bands": [{"name": "B02"}]}}
+    m = requests_mock.get(API_URL + "collections/S2", json=collection)
+    assert conn.describe_collection("S2") == collection
+    assert m.call_count == 1
+    # Check caching
+    assert conn.describe_collection("S2") == collection
+    assert conn.load_collection("S2").metadata.band_names == ["B02"]
+    assert m.call_count == 1
+
+
+def test_describe_collection_error(requests_mock):
+    requests_mock.get(API_URL, json={"api_version": "1.0.0"})
+    conn = Connection(API_URL)
+    m = requests_mock.get(API_URL + "collections/S2", status_code=404, json={"code": "CollectionNotFound"})
+    with pytest.raises(OpenEoApiError):
+        conn.describe_collection("S2")
+    assert m.call_count == 1
+    # Error is not cached
+    with pytest.raises(OpenEoApiError):
+        conn.describe_collection("S2")
+    assert m.call_count == 2
+
+
 def test_get_job(requests_mock):
     requests_mock.get(API_URL, json={"api_version": "1.0.0"})
     conn = Connection(API_URL)
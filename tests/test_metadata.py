@@ -63,6 +63,38 @@ def test_band_dimension_band_index():
         bdim.band_index("yellow")
 
 
+def test_band_dimension_band_index_aliases():
+    bdim = BandDimension(name="spectral", bands=[
+        Band("B02", "blue", 0.490, aliases=["b2", "blauw"]),
+        Band("B03", "green", 0.560, aliases=["b3"]),
+        Band("green", None, 0.570),
+    ])
+    assert bdim.band_index("b2") == 0
+    assert bdim.band_index("blauw") == 0
+    assert bdim.band_index("b3") == 1
+    # Common name takes precedence over band name
+    assert bdim.band_index("green") == 1
+    assert bdim.band_name("b3") == "B03"
+    assert bdim.band_name("blauw", allow_common=False) == "B02"
+
+
+def test_band_dimension_band_index_reassign_bands():
+    bdim = BandDimension(name="spectral", bands=[Band("B02", "blue", 0.490)])
+    assert bdim.band_index("blue") == 0
+    bdim.bands = [Band("B03", "green", 0.560), Band("B02", "blue", 0.490)]
+    assert bdim.band_index("blue") == 1
+    assert bdim.band_index("B03") == 0
+    assert bdim == BandDimension(name="spectral", bands=[Band("B03", "green", 0.560), Band("B02", "blue", 0.490)])
+
+
+def test_band_dimension_band_index_mutate_bands():
+    bdim = BandDimension(name="spectral", bands=[Band("B02", "blue", 0.490)])
+    assert bdim.band_index("blue") == 0
+    bdim.bands.append(Band("B03", "green", 0.560))
+    assert bdim.band_index("B03") == 1
+    assert bdim.band_index("green") == 1
+
+
 def test_band_dimension_band_name():
     bdim = BandDimension(name="spectral", bands=[
         Band("B02", "blue", 0.490),